@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections.abc import Iterable, Iterator
 
 from alembic.autogenerate import comparators
 from alembic.autogenerate.api import AutogenContext
@@ -12,53 +13,64 @@ from alembic_views.operations import CreateViewOp, DropViewOp, ReplaceViewOp
 
 log = logging.getLogger(__name__)
 
+_SQLITE_CREATE_RE = re.compile(r"^CREATE VIEW \S+ AS ", re.I)
+_PG_NL_RE = re.compile("\n *")
+_PG_CAST_RE = re.compile("::[a-z]+")
+
+_PG_VIEWS_QUERY = text(
+    "SELECT schemaname, viewname, definition FROM pg_views WHERE schemaname = ANY(:schemas)"
+)
+
 
 def reflect_sqlite(
     autogen_context: AutogenContext, schemas: list[str]
-) -> dict[tuple[str | None, str], str]:
-    views: dict[tuple[str | None, str], str] = {}
-    for schema in schemas:
-        prefix = schema + "." if schema else ""
-        rows = autogen_context.connection.execute(  # type: ignore[union-attr]
-            text(f"SELECT name, sql FROM {prefix}sqlite_master WHERE type='view'")
+) -> Iterator[tuple[tuple[str | None, str], str]]:
+    quote = autogen_context.dialect.identifier_preparer.quote  # type: ignore[union-attr]
+    selects = []
+    params = {}
+    for i, schema in enumerate(schemas):
+        prefix = quote(schema) + "." if schema else ""
+        selects.append(
+            f"SELECT :schema_{i}, name, sql FROM {prefix}sqlite_master WHERE type='view'"
         )
-        views.update({(schema, row[0]): normalise_sqlite(row[1]) for row in rows})
-    return views
+        params[f"schema_{i}"] = schema
+    if not selects:
+        return
+
+    rows = autogen_context.connection.execute(  # type: ignore[union-attr]
+        text(" UNION ALL ".join(selects)), params
+    )
+    for row in rows:
+        yield (row[0], row[1]), normalise_sqlite(row[2])
 
 
 def normalise_sqlite(definition: str) -> str:
-    return re.sub(r"^CREATE VIEW \S+ AS ", "", definition, flags=re.I).replace("\n", "")
+    return _SQLITE_CREATE_RE.sub("", definition).replace("\n", "")
 
 
 def reflect_postgresql(
     autogen_context: AutogenContext, schemas: list[str]
-) -> dict[tuple[str | None, str], str]:
+) -> Iterator[tuple[tuple[str | None, str], str]]:
+    default_schema = autogen_context.dialect.default_schema_name  # type: ignore[union-attr]
     rows = autogen_context.connection.execute(  # type: ignore[union-attr]
-        text(
-            "SELECT schemaname, viewname, definition FROM pg_views WHERE schemaname = ANY(:schemas)"
-        ),
+        _PG_VIEWS_QUERY,
         {
             "schemas": [
-                autogen_context.dialect.default_schema_name  # type: ignore[union-attr]
-                if schema is None
-                else schema
-                for schema in schemas
+                default_schema if schema is None else schema for schema in schemas
             ]
         },
     )
-    return {
-        (
-            None if row[0] == autogen_context.dialect.default_schema_name else row[0],  # type: ignore[union-attr]
-            row[1],
-        ): normalise_postgresql(row[2])
-        for row in rows
-    }
+    for row in rows:
+        yield (
+            (None if row[0] == default_schema else row[0], row[1]),
+            normalise_postgresql(row[2]),
+        )
 
 
 def normalise_postgresql(definition: str) -> str:
     definition = definition.strip().rstrip(";")
-    definition = re.sub("\n *", " ", definition)
-    return re.sub("::[a-z]+", "", definition)
+    definition = _PG_NL_RE.sub(" ", definition)
+    return _PG_CAST_RE.sub("", definition)
 
 
 def compare_postgresql(sqla_view: str, db_view: str) -> bool:
@@ -71,6 +83,15 @@ def compare_postgresql(sqla_view: str, db_view: str) -> bool:
     return sqla_view == db_view
 
 
+def group_by_schema(
+    views: Iterable[tuple[tuple[str | None, str], str]],
+) -> dict[str | None, dict[str, str]]:
+    grouped: dict[str | None, dict[str, str]] = {}
+    for (schema, name), definition in views:
+        grouped.setdefault(schema, {})[name] = definition
+    return grouped
+
+
 REFLECT_DIALECT = {
     "sqlite": reflect_sqlite,
     "postgresql": reflect_postgresql,
@@ -87,45 +108,53 @@ def compare_views(
     upgrade_ops: UpgradeOps,
     schemas: list[str],
 ) -> None:
-    sqla_views = {
-        k: str(v.compile()).replace("\n", "")
-        for k, v in autogen_context.metadata.info.get("views", {}).items()  # type: ignore[union-attr]
-    }
+    # Metadata without a views entry isn't using this extension, so skip the
+    # reflection query. An empty entry still reflects so that drops are found.
+    views = autogen_context.metadata.info.get("views")  # type: ignore[union-attr]
+    if views is None:
+        return
+
+    sqla_views = group_by_schema(
+        (k, str(v.compile()).replace("\n", "")) for k, v in views.items()
+    )
 
     if autogen_context.dialect.name not in REFLECT_DIALECT:  # type: ignore[union-attr]
         raise NotImplementedError(
             f"Unsupported dialect for view reflection: {autogen_context.dialect.name}"  # type: ignore[union-attr]
         )
-    db_views = REFLECT_DIALECT[autogen_context.dialect.name](autogen_context, schemas)  # type: ignore[union-attr]
-
-    for schema, name in set(sqla_views) - set(db_views):
-        if autogen_context.run_name_filters(name, "view", {"schema_name": schema}):  # type: ignore[arg-type]
-            log.info("Detected added view '%s'", name)
-            upgrade_ops.ops.append(
-                CreateViewOp(name, sqla_views[(schema, name)], schema)
-            )
-
-    for schema, name in set(db_views) - set(sqla_views):
-        if autogen_context.run_name_filters(name, "view", {"schema_name": schema}):  # type: ignore[arg-type]
-            log.info("Detected removed view '%s'", name)
-            upgrade_ops.ops.append(
-                DropViewOp(name, schema, old_definition=db_views[(schema, name)])
-            )
-
-    for schema, name in set(sqla_views) & set(db_views):
-        if autogen_context.run_name_filters(name, "view", {"schema_name": schema}):  # type: ignore[arg-type]
-            if not COMPARE_DIALECT.get(
-                autogen_context.dialect.name,  # type: ignore[union-attr]
-                lambda x, y: x == y,
-            )(sqla_views[(schema, name)], db_views[(schema, name)]):
+    db_views = group_by_schema(
+        REFLECT_DIALECT[autogen_context.dialect.name](autogen_context, schemas)  # type: ignore[union-attr]
+    )
+
+    compare = COMPARE_DIALECT.get(
+        autogen_context.dialect.name,  # type: ignore[union-attr]
+        lambda x, y: x == y,
+    )
+
+    for schema in sqla_views.keys() | db_views.keys():
+        sqla_schema_views = sqla_views.get(schema, {})
+        db_schema_views = db_views.get(schema, {})
+
+        for name in sqla_schema_views.keys() | db_schema_views.keys():
+            if not autogen_context.run_name_filters(
+                name,
+                "view",  # type: ignore[arg-type]
+                {"schema_name": schema},
+            ):
+                continue
+
+            sqla_view = sqla_schema_views.get(name)
+            db_view = db_schema_views.get(name)
+            if sqla_view is None:
+                log.info("Detected removed view '%s'", name)
+                upgrade_ops.ops.append(DropViewOp(name, schema, old_definition=db_view))
+            elif db_view is None:
+                log.info("Detected added view '%s'", name)
+                upgrade_ops.ops.append(CreateViewOp(name, sqla_view, schema))
+            elif not compare(sqla_view, db_view):
                 log.info("Detected changed view '%s'", name)
-                log.debug("SQLAlchemy definition: |%s|", sqla_views[(schema, name)])
-                log.debug("Database definition: |%s|", db_views[(schema, name)])
+                log.debug("SQLAlchemy definition: |%s|", sqla_view)
+                log.debug("Database definition: |%s|", db_view)
                 upgrade_ops.ops.append(
-                    ReplaceViewOp(
-                        name,
-                        sqla_views[(schema, name)],
-                        schema,
-                        old_definition=db_views[(schema, name)],
-                    )
+                    ReplaceViewOp(name, sqla_view, schema, old_definition=db_view)
                 )
@@ -5,6 +5,16 @@ from typing import Any
 from alembic.autogenerate import renderers
 from alembic.autogenerate.api import AutogenContext
 from alembic.operations import MigrateOperation, Operations
+from sqlalchemy.engine import Dialect
+
+
+def _qualified_name(
+    dialect: Dialect, operation: "CreateViewOp | ReplaceViewOp | DropViewOp"
+) -> str:
+    quote = dialect.identifier_preparer.quote
+    if operation.schema:
+        return f"{quote(operation.schema)}.{quote(operation.name)}"
+    return quote(operation.name)
 
 
 @Operations.register_operation("create_view")
@@ -34,12 +44,7 @@ class CreateViewOp(MigrateOperation):
 
 @Operations.implementation_for(CreateViewOp)
 def create_view(operations: Operations, operation: CreateViewOp) -> None:
-    quote = operations.get_bind().engine.dialect.identifier_preparer.quote
-    name = (
-        f"{quote(operation.schema)}.{quote(operation.name)}"
-        if operation.schema
-        else quote(operation.name)
-    )
+    name = _qualified_name(operations.get_bind().dialect, operation)
     operations.execute(f"CREATE VIEW {name} AS {operation.definition}")
 
 
@@ -47,7 +52,7 @@ def create_view(operations: Operations, operation: CreateViewOp) -> None:
 def render_create_view(
     _autogen_context: AutogenContext, operation: CreateViewOp
 ) -> str:
-    return f"op.create_view({operation.name!r}, '''{operation.definition}''', schema={operation.schema!r})"
+    return f"op.create_view({operation.name!r}, {operation.definition!r}, schema={operation.schema!r})"
 
 
 @Operations.register_operation("replace_view")
@@ -93,14 +98,10 @@ class ReplaceViewOp(MigrateOperation):
 
 @Operations.implementation_for(ReplaceViewOp)
 def replace_view(operations: Operations, operation: ReplaceViewOp) -> None:
-    quote = operations.get_bind().engine.dialect.identifier_preparer.quote
-    name = (
-        f"{quote(operation.schema)}.{quote(operation.name)}"
-        if operation.schema
-        else quote(operation.name)
-    )
-
-    if operation.drop or operations.get_bind().engine.name == "sqlite":
+    dialect = operations.get_bind().dialect
+    name = _qualified_name(dialect, operation)
+
+    if operation.drop or dialect.name == "sqlite":
         operations.execute(f"DROP VIEW {name}")
         operations.execute(f"CREATE VIEW {name} AS {operation.definition}")
     else:
@@ -111,7 +112,7 @@ def replace_view(operations: Operations, operation: ReplaceViewOp) -> None:
 def render_replace_view(
     _autogen_context: AutogenContext, operation: ReplaceViewOp
 ) -> str:
-    return f"op.replace_view({operation.name!r}, '''{operation.definition}''', schema={operation.schema!r})"
+    return f"op.replace_view({operation.name!r}, {operation.definition!r}, schema={operation.schema!r})"
 
 
 @Operations.register_operation("drop_view")
@@ -119,7 +120,6 @@ class DropViewOp(MigrateOperation):
     def __init__(
         self, name: str, schema: str | None, old_definition: str | None = None
     ) -> None:
-        self.schema = schema
         self.name = name
         self.schema = schema
         self.old_definition = old_definition
@@ -141,12 +141,7 @@ class DropViewOp(MigrateOperation):
 
 @Operations.implementation_for(DropViewOp)
 def drop_view(operations: Operations, operation: DropViewOp) -> None:
-    quote = operations.get_bind().engine.dialect.identifier_preparer.quote
-    name = (
-        f"{quote(operation.schema)}.{quote(operation.name)}"
-        if operation.schema
-        else quote(operation.name)
-    )
+    name = _qualified_name(operations.get_bind().dialect, operation)
     operations.execute(f"DROP VIEW {name}")
 
 